@@ -1,9 +1,10 @@
 """Calculating \\(\\pi\\) the simple way, but this is called
 dummypi to avoid conflict with simplepi in the databench_examples repo."""
 
-import math
-from time import sleep
-from random import random
+import logging
+from gevent import sleep
+
+import numpy as np
 
 import databench
 
@@ -16,28 +17,39 @@ class Analysis(databench.Analysis):
     def on_run(self):
         """Run when button is pressed."""
 
-        inside = 0
-        for i in xrange(self.samples):
-            sleep(0.001)
-            r1, r2 = (random(), random())
-            if r1*r1 + r2*r2 < 1.0:
-                inside += 1
-
-            if (i+1) % 100 == 0:
-                draws = i+1
-                self.emit('log', {
-                    'draws': draws,
-                    'inside': inside,
-                    'r1': r1,
-                    'r2': r2,
-                })
-
-                p = float(inside)/draws
-                uncertainty = 4.0*math.sqrt(draws*p*(1.0 - p)) / draws
-                self.emit('status', {
-                    'pi-estimate': 4.0*inside/draws,
-                    'pi-uncertainty': uncertainty
-                })
+        # Draw all samples in one vectorized batch. The cumulative sum of
+        # hits makes the running 'inside' count at every emit point a
+        # simple array lookup.
+        samples = self.samples
+        xs = np.random.random(samples)
+        ys = np.random.random(samples)
+        hits = (xs*xs + ys*ys) < 1.0
+        cum_inside = np.cumsum(hits)
+
+        # precompute the whole emitted series in one vectorized pass
+        emit_at = np.arange(99, samples, 100)
+        draws = emit_at + 1.0
+        p = cum_inside[emit_at]/draws
+        estimates = 4.0*p
+        uncertainties = 4.0*np.sqrt(p*(1.0 - p)/draws)
+
+        emit = self.emit
+        for n, i in enumerate(emit_at):
+            sleep(0.01)
+
+            # batch both signals into a single websocket frame
+            emit([
+                ('log', {
+                    'draws': int(i)+1,
+                    'inside': int(cum_inside[i]),
+                    'r1': float(xs[i]),
+                    'r2': float(ys[i]),
+                }),
+                ('status', {
+                    'pi-estimate': float(estimates[n]),
+                    'pi-uncertainty': float(uncertainties[n]),
+                }),
+            ])
 
         self.emit('log', {'action': 'done'})
 
@@ -47,7 +59,8 @@ class Analysis(databench.Analysis):
 
     def on_test_fn(self, first_param, second_param=100):
         """Echo params."""
-        print(first_param, second_param)
+        logging.debug('test_fn params: ' +
+                      str((first_param, second_param)))
         self.emit('test_fn', {
             'first_param': first_param,
             'second_param': second_param,
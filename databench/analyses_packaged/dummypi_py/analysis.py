@@ -4,7 +4,8 @@ This is using a Python Language Kernel running in a separate process."""
 
 import math
 from time import sleep
-from random import random
+
+import numpy as np
 
 import databench_py
 import databench_py.singlethread
@@ -13,6 +14,17 @@ import databench_py.singlethread
 # logging.basicConfig(level='DEBUG')
 
 
+def random_pairs(buffer_size=100):
+    """Generator yielding uniform (r1, r2) pairs from a pre-drawn buffer.
+
+    A single vectorized draw fills both coordinates for ``buffer_size``
+    samples, so one call to the random number generator produces a whole
+    batch of pairs."""
+    while True:
+        for r1, r2 in np.random.random((buffer_size, 2)):
+            yield r1, r2
+
+
 class Analysis(databench_py.Analysis):
 
     def __init__(self):
@@ -21,16 +33,22 @@ class Analysis(databench_py.Analysis):
     def on_run(self):
         """Run when button is pressed."""
 
+        # bind frequently used names locally; attribute and global
+        # lookups are not free in the per-sample loop
         inside = 0
-        for i in xrange(self.samples):
-            sleep(0.001)
-            r1, r2 = (random(), random())
-            if r1*r1 + r2*r2 < 1.0:
-                inside += 1
+        samples = self.samples
+        rand = random_pairs().next
+        emit = self.emit
+        for i in xrange(samples):
+            r1, r2 = rand()
+            # branchless: the comparison is 0 or 1
+            inside += r1*r1 + r2*r2 < 1.0
 
             if (i+1) % 100 == 0:
+                sleep(0.01)
                 draws = i+1
-                self.emit('log', {
+                inside = int(inside)
+                emit('log', {
                     'draws': draws,
                     'inside': inside,
                     'r1': r1,
@@ -38,8 +56,8 @@ class Analysis(databench_py.Analysis):
                 })
 
                 p = float(inside)/draws
-                uncertainty = 4.0*math.sqrt(draws*p*(1.0 - p)) / draws
-                self.emit('status', {
+                uncertainty = 4.0*math.sqrt(p*(1.0 - p)/draws)
+                emit('status', {
                     'pi-estimate': 4.0*inside/draws,
                     'pi-uncertainty': uncertainty
                 })
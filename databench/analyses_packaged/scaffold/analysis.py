@@ -2,7 +2,7 @@
 
 import databench
 
-import time
+import gevent
 import datetime
 
 
@@ -14,7 +14,7 @@ class Analysis(databench.Analysis):
         CHANGEME
         """
         self.emit('log', 'backend is connected and initialized')
-        time.sleep(3)
+        gevent.sleep(3)
         self.emit('ready', 'ready at ' +
                   datetime.datetime.now().isoformat())
 
@@ -25,7 +25,7 @@ class Analysis(databench.Analysis):
         CHANGEME
         """
 
-        time.sleep(3)
+        gevent.sleep(3)
         self.emit('log', 'Backend received the confirmation from the frontend '
                   'that the ready signal was received.')
 
@@ -55,7 +55,12 @@ class Analysis(object):
         self.emit('result', {'msg': 'done'})
 
     to send the signal ``result`` with the message ``{'msg': 'done'}`` to
-    the frontend.
+    the frontend. To reduce the number of websocket frames in tight loops,
+    a list of ``(signal, message)`` pairs can be emitted in a single frame:
+
+    .. code-block:: python
+
+        self.emit([('log', {'i': i}), ('status', {'p': p})])
 
     """
 
@@ -265,18 +270,23 @@ class Meta(object):
                 return m
             return m
 
-        def emit(signal, message):
+        def emit(signal, message=None):
             # JavaScripts JSON.parse() cannot handle Infinity and NaN.
             # To prevent the entire message from failing, this casts them to
             # strings.
-            message = sanitize_message(message)
+            if isinstance(signal, list):
+                # a list of (signal, message) pairs is batched into a
+                # single websocket frame
+                payload = [{'signal': s, 'load': sanitize_message(m)}
+                           for s, m in signal]
+            else:
+                payload = {'signal': signal,
+                           'load': sanitize_message(message)}
             try:
-                ws.send(json.dumps(
-                    {'signal': signal, 'load': message}
-                ).encode('utf-8'))
+                ws.send(json.dumps(payload).encode('utf-8'))
             except geventwebsocket.WebSocketError:
-                logging.info('websocket closed. could not send: '+signal +
-                             ' -- '+str(message))
+                logging.info('websocket closed. could not send: ' +
+                             str(signal)+' -- '+str(message))
 
         analysis_instance = self.instantiate_analysis_class()
         logging.debug("analysis instantiated")
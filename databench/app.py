@@ -18,6 +18,19 @@ from .analysis import Meta, MetaZMQ
 from . import __version__ as DATABENCH_VERSION
 
 
+def analysis_folders(suffix, _cache={}):
+    """Discover analysis folders for a language kernel suffix.
+
+    The result is memoized, so the filesystem is only scanned once per
+    suffix per process."""
+    if suffix not in _cache:
+        folders = glob.glob('analyses/*'+suffix)
+        if not folders:
+            folders = glob.glob('databench/analyses_packaged/*'+suffix)
+        _cache[suffix] = folders
+    return _cache[suffix]
+
+
 class App(object):
     """Similar to a Flask app. The actual Flask instance is injected.
 
@@ -57,10 +70,11 @@ class App(object):
         self.analyses_version = None
 
         self.spawned_analyses = {}
+        self._index_page = None
 
-        self.flask_app.debug = True
-        self.flask_app.use_reloader = True
-        self.flask_app.config['SECRET_KEY'] = 'ajksdfjhkasdfj'  # change
+        self.flask_app.debug = bool(os.environ.get('DATABENCH_DEBUG'))
+        self.flask_app.config['SECRET_KEY'] = \
+            os.environ.get('SECRET_KEY', os.urandom(24))
 
         if delimiters:
             self.custom_delimiters(delimiters)
@@ -91,9 +105,8 @@ class App(object):
     def custom_delimiters(self, delimiters):
         """Change the standard jinja2 delimiters to allow those delimiters be
         used by frontend template engines."""
-        options = self.flask_app.jinja_options.copy()
-        options.update(delimiters)
-        self.flask_app.jinja_options = options
+        self.flask_app.jinja_options = dict(self.flask_app.jinja_options,
+                                            **delimiters)
 
     def add_jinja2_highlight(self):
         """Add jinja2 highlighting."""
@@ -103,15 +116,19 @@ class App(object):
 
     def add_read_file(self):
         """Add read_file capability."""
+        cache = {}
+
         def read_file(filename):
             folder = os.getcwd()+'/analyses/'
             if not os.path.isdir(folder):
                 folder = os.getcwd()+'/databench/analyses_packaged/'
-            return codecs.open(
-                folder+filename,
-                'r',
-                'utf-8'
-            ).readlines()
+            path = folder+filename
+            # key on mtime as well so edited files are re-read
+            key = (path, os.path.getmtime(path))
+            if key not in cache:
+                with codecs.open(path, 'r', 'utf-8') as f:
+                    cache[key] = f.readlines()
+            return cache[key]
         self.flask_app.jinja_env.globals['read_file'] = read_file
 
     def add_markdown(self):
@@ -122,11 +139,7 @@ class App(object):
                  safe_mode=False)
 
     def register_analyses_py(self, zmq_publish):
-        analysis_folders = glob.glob('analyses/*_py')
-        if not analysis_folders:
-            analysis_folders = glob.glob('databench/analyses_packaged/*_py')
-
-        for analysis_folder in analysis_folders:
+        for analysis_folder in analysis_folders('_py'):
             name = analysis_folder[analysis_folder.rfind('/')+1:]
             if name[0] in ['.', '_']:
                 continue
@@ -136,13 +149,7 @@ class App(object):
                     zmq_publish)
 
     def register_analyses_pyspark(self, zmq_publish):
-        analysis_folders = glob.glob('analyses/*_pyspark')
-        if not analysis_folders:
-            analysis_folders = glob.glob(
-                'databench/analyses_packaged/*_pyspark'
-            )
-
-        for analysis_folder in analysis_folders:
+        for analysis_folder in analysis_folders('_pyspark'):
             name = analysis_folder[analysis_folder.rfind('/')+1:]
             if name[0] in ['.', '_']:
                 continue
@@ -152,11 +159,7 @@ class App(object):
                     zmq_publish)
 
     def register_analyses_go(self, zmq_publish):
-        analysis_folders = glob.glob('analyses/*_go')
-        if not analysis_folders:
-            analysis_folders = glob.glob('databench/analyses_packaged/*_go')
-
-        for analysis_folder in analysis_folders:
+        for analysis_folder in analysis_folders('_go'):
             name = analysis_folder[analysis_folder.rfind('/')+1:]
             if name[0] in ['.', '_']:
                 continue
@@ -169,7 +172,8 @@ class App(object):
     def import_analyses(self):
         """Add analyses from the analyses folder."""
 
-        sys.path.append('.')
+        if '.' not in sys.path:
+            sys.path.append('.')
         try:
             import analyses
         except ImportError, e:
@@ -177,13 +181,13 @@ class App(object):
                 traceback.print_exc(file=sys.stdout)
                 raise e
 
-            print "Did not find 'analyses' module."
+            logging.info("Did not find 'analyses' module.")
             logging.debug('sys.path: '+str(sys.path))
             logging.debug('os.path.dirname(os.path.realpath(__file__)): ' +
                           os.path.dirname(os.path.realpath(__file__)))
             logging.debug('os.getcwd: '+os.getcwd())
 
-            print "Using packaged analyses."
+            logging.info('Using packaged analyses.')
             from databench import analyses_packaged as analyses
 
         self.description = analyses.__doc__
@@ -224,9 +228,12 @@ class App(object):
     def register_analyses(self):
         """Register analyses (analyses need to be imported first)."""
 
-        for meta in Meta.all_instances:
-            print 'Registering analysis meta information ' + meta.name + \
-                  ' as blueprint in flask.'
+        # snapshot the global registry once; render_index reuses this
+        # list instead of walking Meta.all_instances on every request
+        self.metas = list(Meta.all_instances)
+        for meta in self.metas:
+            logging.info('Registering analysis meta information ' +
+                         meta.name + ' as blueprint in flask.')
             self.flask_app.register_blueprint(
                 meta.blueprint,
                 url_prefix='/'+meta.name
@@ -238,12 +245,17 @@ class App(object):
             meta.header = self.header
 
     def render_index(self):
-        """Render the List-of-Analyses overview page."""
-        return render_template(
-            'index.html',
-            analyses=Meta.all_instances,
-            analyses_author=self.analyses_author,
-            analyses_version=self.analyses_version,
-            header=self.header,
-            description=self.description,
-        )
+        """Render the List-of-Analyses overview page.
+
+        The page only depends on state determined at startup, so the
+        rendered html is cached after the first request."""
+        if self._index_page is None:
+            self._index_page = render_template(
+                'index.html',
+                analyses=self.metas,
+                analyses_author=self.analyses_author,
+                analyses_version=self.analyses_version,
+                header=self.header,
+                description=self.description,
+            )
+        return self._index_page
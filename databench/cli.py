@@ -65,22 +65,17 @@ def main():
         logging.basicConfig(level=getattr(logging, args.loglevel))
 
     # delimiters
+    delimiter_keys = (
+        'variable_start_string', 'variable_end_string',
+        'block_start_string', 'block_end_string',
+        'comment_start_string', 'comment_end_string',
+    )
     delimiters = {
         'variable_start_string': '[[',
         'variable_end_string': ']]',
     }
-    if args.variable_start_string:
-        delimiters['variable_start_string'] = args.variable_start_string
-    if args.variable_end_string:
-        delimiters['variable_end_string'] = args.variable_end_string
-    if args.block_start_string:
-        delimiters['block_start_string'] = args.block_start_string
-    if args.block_end_string:
-        delimiters['block_end_string'] = args.block_end_string
-    if args.comment_start_string:
-        delimiters['comment_start_string'] = args.comment_start_string
-    if args.comment_end_string:
-        delimiters['comment_end_string'] = args.comment_end_string
+    delimiters.update((k, getattr(args, k))
+                      for k in delimiter_keys if getattr(args, k))
 
     print '--- databench v'+DATABENCH_VERSION+' ---'
     logging.info('host='+str(args.host)+', port='+str(args.port))
@@ -98,13 +93,16 @@ def main():
     if hasattr(signal, 'SIGUSR1'):
         signal.signal(signal.SIGUSR1, sig_handler)
 
-    @werkzeug.serving.run_with_reloader
-    def reloader():
+    def run():
         app = App(__name__, host=args.host, port=args.port,
                   delimiters=delimiters)
         app.run()
         return app
-    return reloader()
+
+    # only pay for the werkzeug reloader when debugging
+    if os.environ.get('DATABENCH_DEBUG'):
+        return werkzeug.serving.run_with_reloader(run)
+    return run()
 
 
 if __name__ == '__main__':
@@ -67,6 +67,17 @@ function Databench(opts) {
 		socket.onmessage = function(event) {
 			var message_data = JSON.parse(event.data);
 
+			// an array is a batch of messages in a single frame
+			if (message_data instanceof Array) {
+				for (var i = 0; i < message_data.length; i++) {
+					process_message(message_data[i]);
+				}
+				return;
+			}
+			process_message(message_data);
+		}
+
+		var process_message = function(message_data) {
 			// normal message
 			if (message_data.signal in on_callbacks) {
 				for(cb in on_callbacks[message_data.signal]) {
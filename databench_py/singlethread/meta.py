@@ -28,7 +28,7 @@ class Meta(object):
         self.analysis_instances = {}
 
         self._init_zmq()
-        print 'Language kernel for '+self.name+' initialized.'
+        logging.info('Language kernel for '+self.name+' initialized.')
 
     def _init_zmq(self, sub_port=8041):
         """Initialize zmq messaging. Listen on sub_port. This port might at
@@ -26,6 +26,7 @@ INSTALL_REQUIRES = [
     'Werkzeug>=0.9.4',
     'pyzmq>=4.3.1',
     'zipstream>=1.0.4',
+    'numpy>=1.8.0',
 ]
 
 